@@ -1,6 +1,7 @@
 import os
 import pickle
 import sqlite3
+from functools import lru_cache
 
 from ..models import Code
 
@@ -22,6 +23,7 @@ def select_all(catalog_name):
     return {pickle.loads(k): pickle.loads(v) for k, v in c.fetchall()}
 
 
+@lru_cache(maxsize=4096)
 def catalog_code(catalog_name, key, index=None):
     code = key
     if isinstance(key, tuple):
@@ -78,7 +78,13 @@ class CFDI(XElement):
         if base_url:
             return base_url + "?" + "&".join(f"{k}={v}" for k, v in q.items())
 
-    def cadena_original(self):
+    def cadena_original(self) -> str:
+        return str(self._cadena_original())
+
+    def cadena_original_bytes(self) -> bytes:
+        return bytes(self._cadena_original())
+
+    def _cadena_original(self):
         transform = xslt_transform(self.tag, self['Version'])
         xml = super().to_xml()
-        return str(transform(xml))
+        return transform(xml)
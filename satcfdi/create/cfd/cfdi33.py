@@ -8,7 +8,7 @@ from ...utils import ScalarMap
 
 
 class Impuesto(cfdi40.Impuesto):
-    pass
+    __slots__ = ()
 
 
 class CfdiRelacionados(ScalarMap):
@@ -19,6 +19,8 @@ class CfdiRelacionados(ScalarMap):
     :param cfdi_relacionado: Nodo requerido para precisar la información de los comprobantes relacionados.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             tipo_relacion: str,
@@ -44,6 +46,8 @@ class Parte(ScalarMap):
     :param informacion_aduanera: Nodo opcional para introducir la información aduanera aplicable cuando se trate de ventas de primera mano de mercancías importadas o se trate de operaciones de comercio exterior con bienes o servicios.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             clave_prod_serv: str,
@@ -78,6 +82,8 @@ class Traslado(ScalarMap):
     :param importe: Atributo condicional para señalar la suma del importe del impuesto trasladado, agrupado por impuesto, TipoFactor y TasaOCuota. No se permiten valores negativos.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             base: Decimal | int,
@@ -106,6 +112,8 @@ class Retencion(ScalarMap):
     :param importe: Atributo condicional para señalar la suma del importe del impuesto trasladado, agrupado por impuesto, TipoFactor y TasaOCuota. No se permiten valores negativos.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             base: Decimal | int,
@@ -131,6 +139,8 @@ class Impuestos(ScalarMap):
     :param traslados: Nodo condicional para capturar los impuestos trasladados aplicables. Es requerido cuando en los conceptos se registre un impuesto trasladado.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             retenciones: Retencion | dict | str | Sequence[Retencion | dict | str] = None,
@@ -161,6 +171,8 @@ class Concepto(ScalarMap):
     :param _traslados_incluidos: si el valor valor_unitario ya incluye traslados.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             clave_prod_serv: str,
@@ -207,6 +219,8 @@ class Receptor(ScalarMap):
     :param num_reg_id_trib: Atributo condicional para expresar el número de registro de identidad fiscal del receptor cuando sea residente en el extranjero. Es requerido cuando se incluya el complemento de comercio exterior.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             rfc: str,
@@ -233,6 +247,8 @@ class Emisor(ScalarMap):
     :param nombre: Atributo opcional para registrar el nombre, denominación o razón social del contribuyente emisor del comprobante.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             rfc: str,
@@ -250,3 +266,5 @@ class Comprobante(cfdi40.Comprobante):
     tag = '{http://www.sat.gob.mx/cfd/3}Comprobante'
     version = '3.3'
     complemento_pago = pago10.Pagos
+    uso_cfdi_pago = "P01"
+    uso_cfdi_nomina = "P01"
@@ -3,6 +3,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 
 from satcfdi.create.cfd.catalogos import Impuesto as CatImpuesto
 from . import pago20
@@ -12,7 +13,16 @@ from ..compute import make_impuestos, rounder, make_impuesto, \
 from ...cfdi import CFDI
 from ...transform import get_timezone
 from ...utils import ScalarMap
-from ...utils import iterate
+from ...utils import iterate, EMPTY
+
+_IMPUESTOS = {i.name: i for i in CatImpuesto}
+_CONCEPTO_NOMINA = {
+    'clave_prod_serv': '84111505',
+    'cantidad': 1,
+    'clave_unidad': 'ACT',
+    'descripcion': 'Pago de nómina',
+    'objeto_imp': "03",
+}
 
 
 class Impuesto(ScalarMap):
@@ -26,6 +36,8 @@ class Impuesto(ScalarMap):
     :param importe: Atributo condicional para señalar la suma del importe del impuesto trasladado, agrupado por impuesto, TipoFactor y TasaOCuota. No se permiten valores negativos.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             impuesto: str,
@@ -36,7 +48,7 @@ class Impuesto(ScalarMap):
     ):
         super().__init__({
             'Base': base,
-            'Impuesto': CatImpuesto.get(impuesto, impuesto),
+            'Impuesto': _IMPUESTOS.get(impuesto, impuesto),
             'TipoFactor': tipo_factor,
             'TasaOCuota': tasa_o_cuota,
             'Importe': importe,
@@ -44,14 +56,20 @@ class Impuesto(ScalarMap):
 
     @classmethod
     def parse(cls, impuesto: str) -> 'Impuesto':
-        parts = impuesto.split("|")
+        impuesto, tipo_factor, tasa_o_cuota = _parse_impuesto(impuesto)
         return cls(
-            impuesto=parts[0],
-            tipo_factor=parts[1],
-            tasa_o_cuota=Decimal(parts[2]) if len(parts) > 2 else None
+            impuesto=impuesto,
+            tipo_factor=tipo_factor,
+            tasa_o_cuota=tasa_o_cuota
         )
 
 
+@lru_cache(maxsize=256)
+def _parse_impuesto(impuesto: str) -> tuple:
+    parts = impuesto.split("|")
+    return _IMPUESTOS.get(parts[0], parts[0]), parts[1], Decimal(parts[2]) if len(parts) > 2 else None
+
+
 class CfdiRelacionados(ScalarMap):
     """
     Nodo opcional para precisar la información de los comprobantes relacionados.
@@ -60,6 +78,8 @@ class CfdiRelacionados(ScalarMap):
     :param cfdi_relacionado: Nodo requerido para precisar la información de los comprobantes relacionados.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             tipo_relacion: str,
@@ -80,6 +100,8 @@ class InformacionGlobal(ScalarMap):
     :param ano: Atributo requerido para expresar el año al que corresponde la información del comprobante global.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             periodicidad: str,
@@ -107,6 +129,8 @@ class Parte(ScalarMap):
     :param informacion_aduanera: Nodo opcional para introducir la información aduanera aplicable cuando se trate de ventas de primera mano de mercancías importadas o se trate de operaciones de comercio exterior con bienes o servicios.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             clave_prod_serv: str,
@@ -140,6 +164,8 @@ class ACuentaTerceros(ScalarMap):
     :param domicilio_fiscal_a_cuenta_terceros: Atributo requerido para incorporar el código postal del domicilio fiscal del Tercero, a cuenta del que se realiza la operación.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             rfc_a_cuenta_terceros: str,
@@ -166,6 +192,8 @@ class Traslado(ScalarMap):
     :param importe: Atributo condicional para señalar la suma del importe del impuesto trasladado, agrupado por impuesto, TipoFactor y TasaOCuota. No se permiten valores negativos.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             base: Decimal | int,
@@ -194,6 +222,8 @@ class Retencion(ScalarMap):
     :param importe: Atributo condicional para señalar la suma del importe del impuesto trasladado, agrupado por impuesto, TipoFactor y TasaOCuota. No se permiten valores negativos.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             base: Decimal | int,
@@ -219,6 +249,8 @@ class Impuestos(ScalarMap):
     :param traslados: Nodo condicional para capturar los impuestos trasladados aplicables. Es requerido cuando en los conceptos se registre un impuesto trasladado.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             retenciones: Retencion | dict | str | Sequence[Retencion | dict | str] = None,
@@ -251,6 +283,8 @@ class Concepto(ScalarMap):
     :param _traslados_incluidos: si el valor valor_unitario ya incluye traslados.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             clave_prod_serv: str,
@@ -303,6 +337,8 @@ class Receptor(ScalarMap):
     :param num_reg_id_trib: Atributo condicional para expresar el número de registro de identidad fiscal del receptor cuando sea residente en el extranjero. Es requerido cuando se incluya el complemento de comercio exterior.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             rfc: str,
@@ -334,6 +370,8 @@ class Emisor(ScalarMap):
     :param fac_atr_adquirente: Atributo condicional para expresar el número de operación proporcionado por el SAT cuando se trate de un comprobante a través de un PCECFDI o un PCGCFDISP.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             rfc: str,
@@ -366,17 +404,33 @@ class PagoComprobante:
             raise ValueError('Importe Pagado debe de ser menor o igual al Importe Saldo Anterior')
 
 
+def _parse_impuestos(impuestos) -> list:
+    # a single Impuesto or string is the common case
+    if isinstance(impuestos, str):
+        return [Impuesto.parse(impuestos)]
+    if isinstance(impuestos, ScalarMap):
+        return [impuestos]
+    return [x if isinstance(x, dict) else Impuesto.parse(x) for x in iterate(impuestos)]
+
+
 def _make_conceptos(conceptos, rnd_fn):
     def make_concepto(concepto):
-        impuestos = concepto.get("Impuestos") or {}
-        trasladados = [x if isinstance(x, dict) else Impuesto.parse(x) for x in iterate(impuestos.get("Traslados"))]
-        retenciones = [x if isinstance(x, dict) else Impuesto.parse(x) for x in iterate(impuestos.get("Retenciones"))]
+        impuestos = concepto.get("Impuestos") or EMPTY
+        trasladados = _parse_impuestos(impuestos.get("Traslados"))
+        retenciones = _parse_impuestos(impuestos.get("Retenciones"))
 
         if concepto.get('_traslados_incluidos'):
-            s_tasa = sum(c["TasaOCuota"] for c in trasladados if c["TipoFactor"] == "Tasa")
-            s_cuota = sum(c["TasaOCuota"] for c in trasladados if c["TipoFactor"] == "Cuota")
-            if any(c for c in trasladados if c["TipoFactor"] in ('Tasa', 'Cuota') and (c.get('Base') is not None or c.get('Importe') is not None)):
-                raise ValueError("Not possible to compute '_traslados_incluidos' if any 'trasladados' contains 'Base' or 'Importe'")
+            s_tasa = s_cuota = 0
+            for c in trasladados:
+                tipo_factor = c["TipoFactor"]
+                if tipo_factor == "Tasa":
+                    s_tasa += c["TasaOCuota"]
+                elif tipo_factor == "Cuota":
+                    s_cuota += c["TasaOCuota"]
+                else:
+                    continue
+                if c.get('Base') is not None or c.get('Importe') is not None:
+                    raise ValueError("Not possible to compute '_traslados_incluidos' if any 'trasladados' contains 'Base' or 'Importe'")
 
             valor_unitario = concepto['ValorUnitario']
             valor_unitario = (valor_unitario - s_cuota) / (s_tasa + 1)
@@ -387,18 +441,22 @@ def _make_conceptos(conceptos, rnd_fn):
         importe = concepto["Cantidad"] * valor_unitario
         concepto["Importe"] = rnd_fn(importe)
 
-        if concepto.get("ObjetoImp") in ("01", "03"):
+        objeto_imp = concepto.get("ObjetoImp")
+        if objeto_imp == "01" or objeto_imp == "03":
             concepto['Impuestos'] = None
         else:
             base = importe - (concepto.get("Descuento") or 0)
-            impuestos = {
-                imp_t: [
-                    make_impuesto(i, base=base, rnd_fn=rnd_fn) for i in imp
-                ]
-                for imp_t, imp in [('Traslados', trasladados), ('Retenciones', retenciones)] if imp
-            }
-            concepto['Impuestos'] = impuestos or None
-            concepto["ObjetoImp"] = "02" if impuestos else "01"
+            impuestos = {}
+            if trasladados:
+                impuestos['Traslados'] = [make_impuesto(i, base=base, rnd_fn=rnd_fn) for i in trasladados]
+            if retenciones:
+                impuestos['Retenciones'] = [make_impuesto(i, base=base, rnd_fn=rnd_fn) for i in retenciones]
+            if impuestos:
+                concepto['Impuestos'] = impuestos
+                concepto["ObjetoImp"] = "02"
+            else:
+                concepto['Impuestos'] = None
+                concepto["ObjetoImp"] = "01"
 
         return concepto
 
@@ -434,6 +492,8 @@ class Comprobante(CFDI):
     tag = '{http://www.sat.gob.mx/cfd/4}Comprobante'
     version = '4.0'
     complemento_pago = pago20.Pagos
+    uso_cfdi_pago = "CP01"
+    uso_cfdi_nomina = "CN01"
 
     def __init__(
             self,
@@ -496,10 +556,17 @@ class Comprobante(CFDI):
         self['TipoDeComprobante'] = self.get('TipoDeComprobante') or 'I'
         self['Exportacion'] = self.get('Exportacion') or '01'
 
-        self["Conceptos"] = conceptos = _make_conceptos(self["Conceptos"], rnd_fn=rounder(self["Moneda"]))
-        self["SubTotal"] = sub_total = sum(c['Importe'] for c in conceptos)
-        descuento = sum(c.get('Descuento') or 0 for c in conceptos)
-        self['Impuestos'] = impuestos = make_impuestos(conceptos)
+        rnd_fn = rounder(self["Moneda"])
+        conceptos = _make_conceptos(self["Conceptos"], rnd_fn=rnd_fn)
+        impuestos = make_impuestos(conceptos)
+
+        self["Conceptos"] = conceptos
+        sub_total = descuento = 0
+        for c in conceptos:
+            sub_total += c['Importe']
+            descuento += c.get('Descuento') or 0
+        self["SubTotal"] = sub_total
+        self['Impuestos'] = impuestos
 
         total = sub_total - descuento
         if impuestos:
@@ -513,7 +580,7 @@ class Comprobante(CFDI):
         self['NoCertificado'] = signer.certificate_number
         self['Certificado'] = signer.certificate_base64()
         self['Sello'] = signer.sign_sha256(
-            self.cadena_original().encode()
+            self.cadena_original_bytes()
         )
 
     @classmethod
@@ -544,10 +611,7 @@ class Comprobante(CFDI):
         :param fecha: Atributo requerido para la expresión de la fecha y hora de expedición del Comprobante Fiscal Digital por Internet. Se expresa en la forma AAAA-MM-DDThh:mm:ss y debe corresponder con la hora local donde se expide el comprobante.
         :return: Comprobante
         """
-        if cls.version == "3.3":
-            receptor["UsoCFDI"] = "P01"
-        else:
-            receptor["UsoCFDI"] = "CP01"
+        receptor = {**receptor, "UsoCFDI": cls.uso_cfdi_pago}
 
         return cls(
             emisor=emisor,
@@ -576,11 +640,11 @@ class Comprobante(CFDI):
     @classmethod
     def _pago_tipo_cambio(cls, moneda, tipo_cambio):
         # CRP204: El campo TipoCambioP no debe estar presente cuando el campo Moneda contenga ^MXN$ en el nodo Pago
-        if cls.complemento_pago.version == "1.0":
-            if moneda == 'MXN' and tipo_cambio == 1:
-                tipo_cambio = None
-        else:
-            if moneda == 'MXN' and tipo_cambio is None:
+        if moneda == 'MXN':
+            if cls.complemento_pago.version == "1.0":
+                if tipo_cambio == 1:
+                    tipo_cambio = None
+            elif tipo_cambio is None:
                 tipo_cambio = 1
         return tipo_cambio
 
@@ -622,22 +686,54 @@ class Comprobante(CFDI):
         comprobantes = [c if isinstance(c, PagoComprobante) else PagoComprobante(comprobante=c) for c in iterate(comprobantes)]
         first_cfdi = comprobantes[0].comprobante
         moneda = first_cfdi['Moneda']
+        # con emisor y receptor tomados del primer comprobante, este no necesita validarse
+        validate_first = bool(emisor or receptor)
 
         emisor = emisor or first_cfdi['Emisor'].copy()
         lugar_expedicion = lugar_expedicion or first_cfdi['LugarExpedicion']
-        receptor = receptor or first_cfdi['Receptor'].copy()
+        receptor = receptor or first_cfdi['Receptor']
 
         tipo_cambio = cls._pago_tipo_cambio(moneda, tipo_cambio)
 
-        if not all(
-                c.comprobante["Moneda"] == moneda
-                and c.comprobante["Emisor"]["Rfc"] == emisor["Rfc"]
-                and c.comprobante["Emisor"]["RegimenFiscal"] == emisor["RegimenFiscal"]
-                and c.comprobante["Receptor"]["Rfc"] == receptor["Rfc"]
-                and c.comprobante["Receptor"].get("RegimenFiscalReceptor") == receptor.get("RegimenFiscalReceptor")
-                for c in comprobantes
-        ):
-            raise ValueError("CFDIS are of different RFC's Emisor/Receptor o Moneda")
+        emisor_rfc = emisor["Rfc"]
+        emisor_regimen = emisor["RegimenFiscal"]
+        receptor_rfc = receptor["Rfc"]
+        receptor_regimen = receptor.get("RegimenFiscalReceptor")
+
+        rnd_fn = rounder(moneda)
+
+        docto_relacionado = []
+        for c in comprobantes:
+            cfdi = c.comprobante
+            if (validate_first or cfdi is not first_cfdi) and not (
+                    cfdi["Moneda"] == moneda
+                    and cfdi["Emisor"]["Rfc"] == emisor_rfc
+                    and cfdi["Emisor"]["RegimenFiscal"] == emisor_regimen
+                    and cfdi["Receptor"]["Rfc"] == receptor_rfc
+                    and cfdi["Receptor"].get("RegimenFiscalReceptor") == receptor_regimen
+            ):
+                raise ValueError("CFDIS are of different RFC's Emisor/Receptor o Moneda")
+
+            has_imp = 'Impuestos' in cfdi
+            docto_relacionado.append({
+                'IdDocumento': cfdi["Complemento"]["TimbreFiscalDigital"]["UUID"],
+                'Serie': cfdi.get("Serie"),
+                'Folio': cfdi.get("Folio"),
+                'MonedaDR': moneda,
+                'EquivalenciaDR': 1,
+                'MetodoDePagoDR': cfdi["MetodoPago"],
+                'NumParcialidad': c.num_parcialidad,
+                'ImpSaldoAnt': c.imp_saldo_ant,
+                'ImpPagado': c.imp_pagado,
+                'ObjetoImpDR': '02' if has_imp else '01',
+                'ImpuestosDR': make_impuestos_dr_parcial(
+                    conceptos=cfdi['Conceptos'],
+                    imp_saldo_ant=c.imp_saldo_ant,
+                    imp_pagado=c.imp_pagado,
+                    total=cfdi["Total"],
+                    rnd_fn=rnd_fn
+                ) if has_imp else None
+            })
 
         return cls.pago(
             emisor=emisor,
@@ -645,27 +741,7 @@ class Comprobante(CFDI):
             receptor=receptor,
             complemento_pago=cls.complemento_pago(
                 pago=[{
-                    'DoctoRelacionado': [
-                        {
-                            'IdDocumento': c.comprobante["Complemento"]["TimbreFiscalDigital"]["UUID"],
-                            'Serie': c.comprobante.get("Serie"),
-                            'Folio': c.comprobante.get("Folio"),
-                            'MonedaDR': c.comprobante["Moneda"],
-                            'EquivalenciaDR': 1,
-                            'MetodoDePagoDR': c.comprobante["MetodoPago"],
-                            'NumParcialidad': c.num_parcialidad,
-                            'ImpSaldoAnt': c.imp_saldo_ant,
-                            'ImpPagado': c.imp_pagado,
-                            'ObjetoImpDR': '02' if 'Impuestos' in c.comprobante else '01',
-                            'ImpuestosDR': make_impuestos_dr_parcial(
-                                conceptos=c.comprobante['Conceptos'],
-                                imp_saldo_ant=c.imp_saldo_ant,
-                                imp_pagado=c.imp_pagado,
-                                total=c.comprobante["Total"],
-                                rnd_fn=rounder(c.comprobante["Moneda"])
-                            ) if 'Impuestos' in c.comprobante else None
-                        } for c in comprobantes
-                    ],
+                    'DoctoRelacionado': docto_relacionado,
                     'FechaPago': fecha_pago,
                     'FormaDePagoP': forma_pago,
                     'MonedaP': moneda,
@@ -708,19 +784,19 @@ class Comprobante(CFDI):
         :param fecha: Atributo requerido para la expresión de la fecha y hora de expedición del Comprobante Fiscal Digital por Internet. Se expresa en la forma AAAA-MM-DDThh:mm:ss y debe corresponder con la hora local donde se expide el comprobante.
         :return: Comprobante
         """
-        if cls.version == "3.3":
-            receptor["UsoCFDI"] = "P01"
-        else:
-            receptor["UsoCFDI"] = "CN01"
+        receptor = {**receptor, "UsoCFDI": cls.uso_cfdi_nomina}
+
+        # TotalPercepciones y TotalOtrosPagos son None cuando el complemento no los incluye
+        valor_unitario = complemento_nomina.get('TotalPercepciones')
+        if valor_unitario is None:
+            valor_unitario = Decimal(0)
+        if (total_otros_pagos := complemento_nomina.get('TotalOtrosPagos')) is not None:
+            valor_unitario += total_otros_pagos
 
         concepto = Concepto(
-            clave_prod_serv='84111505',
-            cantidad=1,
-            clave_unidad='ACT',
-            descripcion='Pago de nómina',
-            valor_unitario=complemento_nomina.get('TotalPercepciones', 0) + complemento_nomina.get('TotalOtrosPagos', 0),
+            **_CONCEPTO_NOMINA,
+            valor_unitario=valor_unitario,
             descuento=complemento_nomina.get('TotalDeducciones'),
-            objeto_imp="03"
         )
         return cls(
             emisor=emisor,
@@ -18,6 +18,8 @@ class Traslado(ScalarMap):
     :param importe: Atributo requerido para señalar el importe del impuesto trasladado. No se permiten valores negativos.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             impuesto: str,
@@ -41,6 +43,8 @@ class Retencion(ScalarMap):
     :param importe: Atributo requerido para señalar el importe o monto del impuesto retenido. No se permiten valores negativos.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             impuesto: str,
@@ -62,6 +66,8 @@ class Impuestos(ScalarMap):
     :param traslados: Nodo condicional para capturar los impuestos trasladados aplicables.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             total_impuestos_retenidos: Decimal | int = None,
@@ -92,6 +98,8 @@ class DoctoRelacionado(ScalarMap):
     :param imp_pagado: Atributo condicional para expresar el importe pagado para el documento relacionado. Es obligatorio cuando exista más de un documento relacionado o cuando existe un documento relacionado y el TipoCambioDR tiene un valor.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             id_documento: str,
@@ -139,6 +147,8 @@ class Pago(ScalarMap):
     :param impuestos: Nodo condicional para expresar el resumen de los impuestos aplicables cuando este documento sea un anticipo.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             fecha_pago: datetime,
@@ -20,6 +20,8 @@ class TrasladoDR(ScalarMap):
     :param importe_dr: Atributo condicional para señalar el importe del impuesto trasladado conforme al monto del pago, aplicable al documento relacionado. No se permiten valores negativos. Es requerido cuando el tipo factor sea Tasa o Cuota.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             base_dr: Decimal | int,
@@ -48,6 +50,8 @@ class RetencionDR(ScalarMap):
     :param importe_dr: Atributo requerido para señalar el importe del impuesto retenido conforme al monto del pago, aplicable al documento relacionado. No se permiten valores negativos.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             base_dr: Decimal | int,
@@ -73,6 +77,8 @@ class ImpuestosDR(ScalarMap):
     :param traslados_dr: Nodo opcional para capturar los impuestos trasladados aplicables conforme al monto del pago recibido.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             retenciones_dr: Sequence[RetencionDR | dict] = None,
@@ -100,6 +106,8 @@ class DoctoRelacionado(ScalarMap):
     :param impuestos_dr: Nodo condicional para registrar los impuestos aplicables conforme al monto del pago recibido, expresados a la moneda del documento relacionado.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             id_documento: str,
@@ -150,6 +158,8 @@ class Pago(ScalarMap):
     :param impuestos_p: Nodo condicional para registrar el resumen de los impuestos aplicables conforme al monto del pago recibido, expresados a la moneda de pago.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             fecha_pago: datetime,
@@ -36,5 +36,5 @@ class TimbreFiscalDigital(CFDI):
         })
 
         self['SelloSAT'] = proveedor.sign_sha1(
-            self.cadena_original().encode()
+            self.cadena_original_bytes()
         )
@@ -39,5 +39,5 @@ class TimbreFiscalDigital(CFDI):
         })
 
         self['SelloSAT'] = proveedor.sign_sha256(
-            self.cadena_original().encode()
+            self.cadena_original_bytes()
         )
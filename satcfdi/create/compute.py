@@ -1,37 +1,56 @@
 from collections import defaultdict
 from decimal import Decimal
+from functools import cache
+from operator import itemgetter
 
 from ..catalogs import moneda_decimales
 from ..transform.helpers import strcode
-from ..utils import iterate
+from ..utils import iterate, EMPTY
+
+_importe = itemgetter('Importe')
 
 
 def rounder(moneda):
-    decimals = moneda_decimales(strcode(moneda))
-    return lambda v: round(v, decimals)
+    return _rounder(strcode(moneda))
+
+
+@cache
+def _rounder(moneda):
+    decimals = moneda_decimales(moneda)
+    exp = Decimal(1).scaleb(-decimals)
+
+    def rnd(v):
+        # quantize es equivalente a round(v, decimals) para Decimal, pero sin pasar por __round__
+        if type(v) is Decimal:
+            return v.quantize(exp)
+        return round(v, decimals)
+
+    return rnd
+
+
+def _add(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a + b
 
 
 def aggregate(sequence, keys: tuple, values: tuple, project=None) -> list:
-    _res = defaultdict(lambda: tuple(None for _ in values))
+    _res = {}
 
-    _keys = lambda obj: tuple(obj.get(i) for i in keys)
-    _values = lambda obj: tuple(obj.get(i) for i in values)
     if callable(project):
         _project = tuple(project(i) for i in keys + values)
     else:
         _project = project or keys + values
 
-    def add(t):
-        a, b = t
-        if a is None:
-            return b
-        if b is None:
-            return a
-        return a + b
-
     for dic in sequence:
-        k = _keys(dic)
-        _res[k] = tuple(add(t) for t in zip(_res[k], _values(dic)))
+        get = dic.get
+        k = tuple(map(get, keys))
+        v = tuple(map(get, values))
+        if (acc := _res.get(k)) is not None:
+            v = tuple(map(_add, acc, v))
+        _res[k] = v
 
     return [
         dict(zip(_project, k + v))
@@ -79,13 +98,13 @@ def make_impuesto(impuesto: dict, base, rnd_fn):
 
 def group_impuestos(elements, pfx="", ofx=""):
     retenciones = aggregate(
-        (t for c in iterate(elements) for t in iterate((c[f"Impuestos{pfx}"] or {}).get(f"Retenciones{pfx}"))),
+        (t for c in iterate(elements) for t in iterate((c[f"Impuestos{pfx}"] or EMPTY).get(f"Retenciones{pfx}"))),
         keys=(f"Impuesto{pfx}",),
         values=(f"Importe{pfx}",),
         project=lambda i: i[:len(i) - len(pfx)] + ofx,
     )
     traslados = aggregate(
-        (t for c in iterate(elements) for t in iterate((c[f"Impuestos{pfx}"] or {}).get(f"Traslados{pfx}"))),
+        (t for c in iterate(elements) for t in iterate((c[f"Impuestos{pfx}"] or EMPTY).get(f"Traslados{pfx}"))),
         keys=(f"Impuesto{pfx}", f"TipoFactor{pfx}", f"TasaOCuota{pfx}"),
         values=(f"Base{pfx}", f"Importe{pfx}"),
         project=lambda i: i[:len(i) - len(pfx)] + ofx,
@@ -106,23 +125,27 @@ def make_impuestos(conceptos):
 
     if retenciones := impuestos.get('Retenciones'):
         impuestos['Retenciones'] = retenciones
-        impuestos['TotalImpuestosRetenidos'] = sum(i["Importe"] for i in retenciones if i["Importe"])
+        impuestos['TotalImpuestosRetenidos'] = sum(filter(None, map(_importe, retenciones)))
 
     if traslados := impuestos.get('Traslados'):
         impuestos['Traslados'] = traslados
-        impuestos['TotalImpuestosTrasladados'] = sum(i["Importe"] for i in traslados if i["Importe"])
+        impuestos['TotalImpuestosTrasladados'] = sum(filter(None, map(_importe, traslados)))
 
     return impuestos or None
 
 
+_DR_PROJECT = ("ImpuestoDR", "TipoFactorDR", "TasaOCuotaDR", "BaseDR", "ImporteDR")
+
+
 def make_impuestos_dr(conceptos):
     impuestos = {}
+    conceptos_impuestos = [c["Impuestos"] or EMPTY for c in conceptos]
     for imp_t in ("Retenciones", "Traslados"):
         imp = aggregate(
-            (t for c in conceptos for t in iterate((c["Impuestos"] or {}).get(imp_t))),
+            (t for c in conceptos_impuestos for t in iterate(c.get(imp_t))),
             keys=("Impuesto", 'TipoFactor', "TasaOCuota"),
             values=("Base", "Importe"),
-            project=lambda i: i + "DR",
+            project=_DR_PROJECT,
         )
 
         if imp:
@@ -174,10 +197,10 @@ def make_pago_totales(pagos):
         tipo_cambio = p.get('TipoCambioP', 1)
         impuestos['MontoTotalPagos'] += p['Monto'] * tipo_cambio
 
-        for retencion in iterate((p["ImpuestosP"] or {}).get("RetencionesP")):
+        for retencion in iterate((p["ImpuestosP"] or EMPTY).get("RetencionesP")):
             impuestos[RETENCIONES_MAP[retencion["ImpuestoP"]]] += retencion["ImporteP"] * tipo_cambio
 
-        for traslado in iterate((p["ImpuestosP"] or {}).get("TrasladosP")):
+        for traslado in iterate((p["ImpuestosP"] or EMPTY).get("TrasladosP")):
             match (traslado["ImpuestoP"], traslado["TipoFactorP"], str(traslado["TasaOCuotaP"])):
                 case ("002", "Tasa", "0.160000"):
                     impuestos['TotalTrasladosBaseIVA16'] += traslado["BaseP"] * tipo_cambio
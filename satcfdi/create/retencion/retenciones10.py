@@ -252,5 +252,5 @@ class Retenciones(CFDI):
         self['NumCert'] = signer.certificate_number
         self['Cert'] = signer.certificate_base64()
         self['Sello'] = signer.sign_sha1(
-            self.cadena_original().encode()
+            self.cadena_original_bytes()
         )
@@ -296,5 +296,5 @@ class Retenciones(CFDI):
         self['NoCertificado'] = signer.certificate_number,
         self['Certificado'] = signer.certificate_base64(),
         self['Sello'] = signer.sign_sha256(
-            self.cadena_original().encode()
+            self.cadena_original_bytes()
         )
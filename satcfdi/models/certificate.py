@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import base64
 from enum import Enum, auto
+from functools import cached_property
 
 from OpenSSL import crypto
 from OpenSSL.crypto import X509
@@ -57,6 +58,10 @@ class Certificate:
         return crypto.dump_certificate(crypto.FILETYPE_ASN1, self.certificate)
 
     def certificate_base64(self) -> str:
+        return self._certificate_base64
+
+    @cached_property
+    def _certificate_base64(self) -> str:
         return base64.b64encode(
             self.certificate_bytes()
         ).decode()
@@ -154,7 +159,7 @@ class Certificate:
         except AttributeError:
             return None
 
-    @property
+    @cached_property
     def certificate_number(self) -> str:
         return f'{self.certificate.get_serial_number():x}'[1::2]
 
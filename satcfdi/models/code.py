@@ -5,6 +5,8 @@ logger = logging.getLogger(__name__)
 
 
 class Code:
+    __slots__ = ('code', 'description')
+
     def __init__(self, code, description):
         self.code = code
         self.description = description
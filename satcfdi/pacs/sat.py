@@ -8,7 +8,7 @@ from abc import abstractmethod
 from collections.abc import Sequence
 from datetime import date, datetime, timedelta
 from enum import IntEnum, Enum
-from functools import cache
+from functools import cache, lru_cache
 from itertools import islice
 from typing import Iterator
 from uuid import UUID
@@ -63,6 +63,12 @@ def _certificate_path(certificate_no):
     return f"{certificate_no[0:6]}/{certificate_no[6:12]}/{certificate_no[12:14]}/{certificate_no[14:16]}/{certificate_no[16:18]}/{certificate_no}"
 
 
+@lru_cache(maxsize=64)
+def _load_certificate(certificate: str) -> Certificate:
+    # los comprobantes de un mismo emisor comparten el certificado
+    return Certificate.load_certificate(base64.b64decode(certificate))
+
+
 @cache
 def _get_listado_69b(refresh_time=REFRESH_TIME):
     try:
@@ -450,9 +456,7 @@ class SAT(PAC):
         else:
             verify_fn = Certificate.verify_sha256
 
-        cert = Certificate.load_certificate(
-            base64.b64decode(certificate)
-        )
+        cert = _load_certificate(certificate)
 
         if not verify_certificate(cert, at=date):
             return False
@@ -465,7 +469,7 @@ class SAT(PAC):
 
         if not verify_fn(
                 self=cert,
-                data=cfdi.cadena_original().encode(),
+                data=cfdi.cadena_original_bytes(),
                 signature=base64.b64decode(seal)
         ):
             return False
@@ -494,7 +498,7 @@ class SAT(PAC):
 
         if not verify_fn(
                 self=cert_sat,
-                data=timbre.cadena_original().encode(),
+                data=timbre.cadena_original_bytes(),
                 signature=base64.b64decode(timbre["SelloSAT"])
         ):
             return False
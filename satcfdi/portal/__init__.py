@@ -1,41 +1,73 @@
 import json
-import pickle
-from time import time
+from functools import cache
+from time import time_ns
 
 import requests
-import urllib3
+from requests.adapters import HTTPAdapter
 from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
 
 from .utils import get_form, generate_token, request_ref_headers, request_verification_token, random_ajax_id
 from ..models import Signer
 from ..exceptions import ResponseError
 
 
+@cache
+def _ssl_context():
+    return create_urllib3_context(ciphers='DEFAULT:HIGH:!DH')
+
+
+class _PortalAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = _ssl_context()
+        return super().init_poolmanager(*args, **kwargs)
+
+
 class PortalManager(requests.Session):
+    HEADERS = {
+        "User-Agent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36',
+        "Accept-Encoding": 'gzip, deflate, br',
+        "Accept": 'text/html,application/xhtml+xml,application/xml',
+        "Connection": "keep-alive",
+        'Pragma': 'no-cache',
+        'Cache-Control': 'no-cache',
+    }
+
     def __init__(self, signer: Signer):
         super().__init__()
-        try:
-            urllib3.util.ssl_.DEFAULT_CIPHERS += ':HIGH:!DH'
-        except:
-            pass
         self.signer = signer
 
-        self.headers = CaseInsensitiveDict(
-            {
-                "User-Agent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36',
-                "Accept-Encoding": 'gzip, deflate, br',
-                "Accept": 'text/html,application/xhtml+xml,application/xml',
-                "Connection": "keep-alive",
-                'Pragma': 'no-cache',
-                'Cache-Control': 'no-cache',
-            }
+        # reintenta solo fallas al conectar, cuando la petición aún no ha sido enviada
+        adapter = _PortalAdapter(
+            pool_maxsize=16,
+            max_retries=Retry(connect=3, read=False, other=0, backoff_factor=0.2)
         )
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+        self.headers = CaseInsensitiveDict(self.HEADERS)
 
     def save_session(self, target):
-        pickle.dump(self.cookies, target)
+        target.write(json.dumps([
+            {
+                'name': c.name,
+                'value': c.value,
+                'domain': c.domain,
+                'path': c.path,
+                'secure': c.secure,
+                'expires': c.expires,
+            } for c in self.cookies
+        ]).encode())
 
     def load_session(self, source):
-        self.cookies.update(pickle.load(source))
+        try:
+            cookies = json.load(source)
+        except (UnicodeDecodeError, json.JSONDecodeError) as ex:
+            raise ValueError("Invalid session file, sessions saved in the old pickle format must be recreated") from ex
+
+        for c in cookies:
+            self.cookies.set_cookie(requests.cookies.create_cookie(**c))
 
     def form(self, action, referer_url, data):
         res = self.post(
@@ -101,6 +133,11 @@ class SATPortal(PortalManager):
 class SATFacturaElectronica(PortalManager):
     BASE_URL = 'https://portal.facturaelectronica.sat.gob.mx'
     REQUEST_CONTEXT = 'appId=cid-v1:20ff76f4-0bca-495f-b7fd-09ca520e39f7'
+    AJAX_HEADERS = {
+        'Origin': BASE_URL,
+        'Authority': BASE_URL,
+        'Request-Context': REQUEST_CONTEXT,
+    }
 
     def __init__(self, signer: Signer):
         super().__init__(signer)
@@ -168,10 +205,7 @@ class SATFacturaElectronica(PortalManager):
         res = self.request(
             method=method,
             url=f'{self.BASE_URL}/{path}',
-            headers={
-                'Origin': self.BASE_URL,
-                'Authority': self.BASE_URL,
-                'Request-Context': self.REQUEST_CONTEXT,
+            headers=self.AJAX_HEADERS | {
                 '__RequestVerificationToken': self._request_verification_token,
                 'Request-Id': f'|{self._ajax_id}.{random_ajax_id()}'  # |pR4Px.o0yAS
             },
@@ -215,7 +249,7 @@ class SATFacturaElectronica(PortalManager):
             params={
                 'rfcValidar': rfc.upper(),
                 'aplicaRegionFronteriza': apply_border_region,
-                "_": int(time() * 1000)
+                "_": time_ns() // 1_000_000
             }
         )
         return json.loads(res)
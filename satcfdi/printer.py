@@ -1,15 +1,21 @@
-from lxml.etree import QName
+from functools import cache
 
-try:
-    import weasyprint
-    PDF_CSS = weasyprint.CSS(string="@page {margin: 1.0cm 1.27cm 1.1cm 0.85cm;}")
-except OSError as ex:
-    weasyprint = None
+from lxml.etree import QName
 
 from .render import PDF_INIT_TEMPLATE
 from .render.environment import CFDIEnvironment
 
 
+@cache
+def _weasyprint():
+    # weasyprint (y sus bibliotecas nativas) se carga hasta generar el primer PDF
+    try:
+        import weasyprint
+    except OSError as ex:
+        raise ImportError("weasyprint is not installed") from ex
+    return weasyprint, weasyprint.CSS(string="@page {margin: 1.0cm 1.27cm 1.1cm 0.85cm;}")
+
+
 class Representable:
     tag = None
 
@@ -32,20 +38,16 @@ class Representable:
         return init_template.render({"c": self, "k": QName(self.tag).localname})
 
     def pdf_write(self, target, templates_path=None):
-        if weasyprint is None:
-            raise ImportError("weasyprint is not installed")
-
+        weasyprint, pdf_css = _weasyprint()
         weasyprint.HTML(string=self.html_str(templates_path=templates_path)).write_pdf(
             target=target,
-            stylesheets=[PDF_CSS]
+            stylesheets=[pdf_css]
         )
 
     def pdf_bytes(self, templates_path=None) -> bytes:
-        if weasyprint is None:
-            raise ImportError("weasyprint is not installed")
-
+        weasyprint, pdf_css = _weasyprint()
         return weasyprint.HTML(string=self.html_str(templates_path=templates_path)).write_pdf(
-            stylesheets=[PDF_CSS]
+            stylesheets=[pdf_css]
         )
 
     @staticmethod
@@ -1,6 +1,6 @@
 import os
 from datetime import datetime
-from functools import cache
+from functools import cache, lru_cache
 import pytz
 from lxml import etree
 
@@ -44,6 +44,7 @@ def _pytz_timezone(tz):
     return pytz.timezone(tz)
 
 
+@lru_cache(maxsize=128)
 def get_timezone(codigo_postal):
     tz = HUSO_HORARIOS[
         codigo_postal_uso_horario(codigo_postal)
@@ -1,24 +1,28 @@
 import enum
 from collections.abc import Sequence, Mapping
+from types import MappingProxyType
 
 from lxml import etree
 
 parser = etree.XMLParser(no_network=True, remove_comments=True, remove_blank_text=True, huge_tree=True, collect_ids=False, remove_pis=True)
+EMPTY = MappingProxyType({})  # mapping vacío de solo lectura, usado como valor por defecto
 
 
 class ScalarMap(dict):
-    pass
+    __slots__ = ()
 
 
 def iterate(item):
+    if item is None:
+        return []
+    if isinstance(item, list | tuple):
+        return item
     if isinstance(item, str | bytes | ScalarMap):
         return [item]
     if isinstance(item, Mapping):
         return item.values()
     if isinstance(item, Sequence):
         return item
-    if item is None:
-        return []
     return [item]
 
 
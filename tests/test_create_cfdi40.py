@@ -6,7 +6,7 @@ from unittest import mock
 import pytest
 
 from satcfdi.cfdi import CFDI
-from satcfdi.create.cfd import cfdi40, nomina12
+from satcfdi.create.cfd import cfdi40, nomina12, pago20
 from satcfdi.create.cfd.cfdi40 import PagoComprobante
 from satcfdi.pacs.sat import SAT
 from tests.utils import get_signer, verify_result, _uuid, get_rfc_pac, stamp_v11, SAT_Certificate_Store_Pruebas, XElementPrettyPrinter
@@ -90,6 +90,93 @@ def test_traslados_incluidos():
         assert invoice["Total"] == valor * Decimal('23.00')
 
 
+def test_traslados_incluidos_con_base():
+    with pytest.raises(ValueError):
+        cfdi40.Comprobante(
+            emisor=cfdi40.Emisor(
+                rfc='H&E951128469',
+                nombre='HERRERIA & ELECTRICOS',
+                regimen_fiscal="601"
+            ),
+            lugar_expedicion="56820",
+            fecha=datetime.fromisoformat("2020-01-01T22:40:38"),
+            receptor=cfdi40.Receptor(
+                rfc='KIJ0906199R1',
+                nombre='KIJ, S.A DE C.V.',
+                uso_cfdi='G03',
+                domicilio_fiscal_receptor="59820",
+                regimen_fiscal_receptor="601"
+            ),
+            conceptos=cfdi40.Concepto(
+                clave_prod_serv='10101702',
+                cantidad=Decimal('23.00'),
+                clave_unidad='E48',
+                descripcion='SERVICIOS DE FACTURACION',
+                valor_unitario=Decimal('15390.30'),
+                impuestos=cfdi40.Impuestos(
+                    traslados=cfdi40.Impuesto(
+                        impuesto='002',
+                        tipo_factor='Tasa',
+                        tasa_o_cuota=Decimal('0.160000'),
+                        base=Decimal('15390.30')
+                    ),
+                ),
+                _traslados_incluidos=True
+            )
+        )
+
+
+def test_impuesto_parse():
+    a = cfdi40.Impuesto.parse('IVA|Tasa|0.160000')
+    b = cfdi40.Impuesto.parse('IVA|Tasa|0.160000')
+    assert a == b
+    assert a is not b
+    assert a == {'Base': None, 'Impuesto': '002', 'TipoFactor': 'Tasa', 'TasaOCuota': Decimal('0.160000'), 'Importe': None}
+
+    a['Base'] = Decimal('100')
+    assert cfdi40.Impuesto.parse('IVA|Tasa|0.160000')['Base'] is None
+
+    assert cfdi40.Impuesto.parse('002|Exento') == {'Base': None, 'Impuesto': '002', 'TipoFactor': 'Exento', 'TasaOCuota': None, 'Importe': None}
+
+
+def test_pago_no_modifica_receptor():
+    receptor = cfdi40.Receptor(
+        rfc='KIJ0906199R1',
+        nombre='KIJ, S.A DE C.V.',
+        uso_cfdi='G03',
+        domicilio_fiscal_receptor="59820",
+        regimen_fiscal_receptor="601"
+    )
+    cfdi = cfdi40.Comprobante.pago(
+        emisor=cfdi40.Emisor(
+            rfc='H&E951128469',
+            nombre='HERRERIA & ELECTRICOS',
+            regimen_fiscal="601"
+        ),
+        lugar_expedicion="56820",
+        fecha=datetime.fromisoformat("2020-01-01T22:40:38"),
+        receptor=receptor,
+        complemento_pago=pago20.Pagos(
+            pago=pago20.Pago(
+                fecha_pago=datetime(2020, 1, 1),
+                forma_de_pago_p='03',
+                moneda_p='MXN',
+                tipo_cambio_p=1,
+                docto_relacionado=pago20.DoctoRelacionado(
+                    id_documento='d6042dc8-d525-4e78-8d1b-092c878bd518',
+                    imp_pagado=Decimal("100.3"),
+                    imp_saldo_ant=Decimal("203.45"),
+                    num_parcialidad=3,
+                    moneda_dr="MXN",
+                    objeto_imp_dr="01"
+                )
+            )
+        )
+    )
+    assert cfdi['Receptor']['UsoCFDI'] == 'CP01'
+    assert receptor['UsoCFDI'] == 'G03'
+
+
 @pytest.mark.parametrize('rfc, xml_file, traslados, retenciones, total, traslado_incluido', invoices)
 @pytest.mark.skip(reason="skiping render for performance reasons")
 def test_create_invoice_render(rfc, xml_file, traslados, retenciones, total, traslado_incluido):
@@ -421,3 +508,126 @@ def test_nomina():
     invoice.sign(signer)
 
     verify_invoice(invoice, f"{xml_file}")
+
+
+def test_nomina_sin_otros_pagos():
+    invoice = cfdi40.Comprobante.nomina(
+        emisor=cfdi40.Emisor(
+            rfc='XIQB891116QE4',
+            nombre='BERENICE XIMO QUEZADA',
+            regimen_fiscal="601"
+        ),
+        receptor=cfdi40.Receptor(
+            rfc='KIJ0906199R1',
+            nombre='KIJ, S.A DE C.V.',
+            uso_cfdi='G03',
+            domicilio_fiscal_receptor="59820",
+            regimen_fiscal_receptor="601"
+        ),
+        lugar_expedicion="56820",
+        complemento_nomina=nomina12.Nomina(
+            receptor={
+                'Curp': 'XIQB891116MCHZRL72',
+                'TipoContrato': '01',
+                'TipoRegimen': '02',
+                'NumEmpleado': '12345678',
+                'PeriodicidadPago': '04',
+                'ClaveEntFed': 'MOR'
+            },
+            percepciones={
+                'Percepcion': [
+                    {
+                        'TipoPercepcion': '001',
+                        'Clave': '001',
+                        'Concepto': 'SUELDO',
+                        'ImporteGravado': Decimal('1200.00'),
+                        'ImporteExento': Decimal('400.00')
+                    }
+                ]
+            },
+            deducciones={
+                'Deduccion': [
+                    {
+                        'TipoDeduccion': '002',
+                        'Clave': '300',
+                        'Concepto': 'ISR A CARGO',
+                        'Importe': Decimal('234.73')
+                    }
+                ]
+            },
+            tipo_nomina='O',
+            fecha_pago=date(2020, 1, 30),
+            fecha_final_pago=date(2020, 1, 31),
+            fecha_inicial_pago=date(2020, 1, 16),
+            num_dias_pagados=Decimal('16.000')
+        ),
+        fecha=datetime.fromisoformat("2020-09-29T22:40:38")
+    )
+
+    assert invoice['Conceptos'][0]['ValorUnitario'] == Decimal('1600.00')
+    assert invoice['Total'] == Decimal('1365.27')
+
+
+def test_create_pago_emisor_distinto():
+    rfc, xml_file, *_ = invoices[0]
+    ingreso_invoice = CFDI.from_file(os.path.join(current_dir, f"{current_filename}/{xml_file}_stamped.xml"))
+
+    with pytest.raises(ValueError):
+        cfdi40.Comprobante.pago_comprobantes(
+            emisor=cfdi40.Emisor(
+                rfc='H&E951128469',
+                nombre='HERRERIA & ELECTRICOS',
+                regimen_fiscal="601"
+            ),
+            lugar_expedicion="56820",
+            comprobantes=ingreso_invoice,
+            fecha_pago=datetime.fromisoformat("2020-01-02T22:40:38"),
+            forma_pago="03",
+        )
+
+
+def test_cadena_original_bytes():
+    _, xml_file, *_ = invoices[0]
+    cfdi = CFDI.from_file(os.path.join(current_dir, f"{current_filename}/{xml_file}_stamped.xml"))
+
+    assert cfdi.cadena_original_bytes() == cfdi.cadena_original().encode()
+    timbre = cfdi['Complemento']['TimbreFiscalDigital']
+    assert timbre.cadena_original_bytes() == timbre.cadena_original().encode()
+
+
+def test_pago_concepto_con_impuestos():
+    invoice = cfdi40.Comprobante(
+        emisor=cfdi40.Emisor(
+            rfc='H&E951128469',
+            nombre='HERRERIA & ELECTRICOS',
+            regimen_fiscal="601"
+        ),
+        lugar_expedicion="56820",
+        fecha=datetime.fromisoformat("2020-01-01T22:40:38"),
+        receptor=cfdi40.Receptor(
+            rfc='KIJ0906199R1',
+            nombre='KIJ, S.A DE C.V.',
+            uso_cfdi='CP01',
+            domicilio_fiscal_receptor="59820",
+            regimen_fiscal_receptor="601"
+        ),
+        conceptos=cfdi40.Concepto(
+            clave_prod_serv='84111506',
+            cantidad=1,
+            clave_unidad='ACT',
+            descripcion='Pago',
+            valor_unitario=Decimal('100.00'),
+            impuestos=cfdi40.Impuestos(
+                traslados='IVA|Tasa|0.160000'
+            ),
+            _traslados_incluidos=True
+        ),
+        moneda='XXX',
+        tipo_de_comprobante='P',
+    )
+
+    concepto = invoice['Conceptos'][0]
+    assert concepto['ValorUnitario'] == Decimal('86')
+    assert concepto['ObjetoImp'] == '02'
+    assert concepto['Impuestos']['Traslados'][0]['Importe'] == Decimal('14')
+    assert invoice['Impuestos']['TotalImpuestosTrasladados'] == Decimal('14')
@@ -1,4 +1,9 @@
+import io
 import os
+import pickle
+
+import pytest
+import requests
 
 from satcfdi.portal.utils import generate_token, verify_token, action_url
 from satcfdi.portal import SATPortal
@@ -53,3 +58,36 @@ def test_start_session():
     os.makedirs(test_dir, exist_ok=True)
     with open(session_file, 'wb') as f:
         res.save_session(f)
+
+
+def test_session_round_trip():
+    signer = get_signer('cacx7605101p8')
+    res = SATPortal(signer)
+    res.cookies.set('SID', 'abc', domain='loginda.siat.sat.gob.mx', path='/nidp', secure=True, expires=2000000000)
+    res.cookies.set('SID', 'xyz', domain='portal.facturaelectronica.sat.gob.mx', path='/')
+
+    f = io.BytesIO()
+    res.save_session(f)
+    f.seek(0)
+
+    loaded = SATPortal(signer)
+    loaded.load_session(f)
+
+    def attrs(jar):
+        return sorted((c.name, c.value, c.domain, c.path, c.secure, c.expires) for c in jar)
+
+    assert attrs(loaded.cookies) == attrs(res.cookies)
+    assert attrs(loaded.cookies) == [
+        ('SID', 'abc', 'loginda.siat.sat.gob.mx', '/nidp', True, 2000000000),
+        ('SID', 'xyz', 'portal.facturaelectronica.sat.gob.mx', '/', False, None),
+    ]
+
+
+def test_load_pickle_session():
+    signer = get_signer('cacx7605101p8')
+    jar = requests.cookies.RequestsCookieJar()
+    jar.set('SID', 'abc', domain='loginda.siat.sat.gob.mx')
+
+    res = SATPortal(signer)
+    with pytest.raises(ValueError, match='pickle'):
+        res.load_session(io.BytesIO(pickle.dumps(jar)))